@@ -10,13 +10,22 @@ The system uses file-based storage with the following file structure:
 
 Each entity is stored in a pipe-delimited format with a header row.
 """
+import atexit
+import csv
 import os
-from datetime import datetime
-from typing import Dict, List, Optional
+import sys
+from collections import defaultdict
+from datetime import date
+from typing import DefaultDict, Dict, Iterable, List, Optional, Set
 from dataclasses import dataclass
 
-@dataclass
+PRODUCT_HEADER = "product_id|name|description|price|stock|supplier_id"
+SUPPLIER_HEADER = "supplier_id|name|contact"
+ORDER_HEADER = "order_id|product_id|quantity|order_date"
+SUPPLIER_ORDER_HEADER = "order_id|supplier_id|product_id|quantity|order_date"
+LOW_STOCK_THRESHOLD = 5
 
+@dataclass(slots=True)
 class Product:
     """
     Represents a product in the inventory system.
@@ -38,24 +47,32 @@ class Product:
 
     def to_string(self) -> str:
         """Converts product data to pipe-delimited string format for file storage."""
-        return f"{self.product_id}|{self.name}|{self.description}|{self.price}|{self.stock}|{self.supplier_id or ''}"
+        return "|".join((self.product_id, self.name, self.description, str(self.price), str(self.stock),
+                         self.supplier_id or ""))
 
     @classmethod
     def from_string(cls, line: str) -> Optional['Product']:
         """Creates a Product instance from a pipe-delimited string.
         Returns None if the input string is invalid or incomplete.
         """
+        return cls.from_fields(line.strip().split("|"))
+
+    @classmethod
+    def from_fields(cls, data: List[str]) -> Optional['Product']:
+        """Creates a Product instance from a list of already split fields.
+        An empty supplier field is treated as no supplier.
+        """
         try:
-            data = line.strip().split("|")
             if len(data) >= 5:
                 price = float(data[3])
                 stock = int(data[4])
-                supplier_id = data[5] if len(data) > 5 else None
-                return cls(data[0], data[1], data[2], price, stock, supplier_id)
+                supplier_id = data[5] if len(data) > 5 else ""
+                return cls(sys.intern(data[0]), data[1], data[2], price, stock,
+                           sys.intern(supplier_id) if supplier_id else None)
         except (ValueError, IndexError):
             return None
 
-@dataclass
+@dataclass(slots=True)
 class Supplier:
     """
     Represents a supplier in the inventory system.
@@ -70,19 +87,23 @@ class Supplier:
 
     def to_string(self) -> str:
         """Converts supplier data to pipe-delimited string format for file storage."""
-        return f"{self.supplier_id}|{self.name}|{self.contact}"
+        return "|".join((self.supplier_id, self.name, self.contact))
 
     @classmethod
     def from_string(cls, line: str) -> Optional['Supplier']:
         """Creates a Supplier instance from a pipe-delimited string."""
+        return cls.from_fields(line.strip().split("|"))
+
+    @classmethod
+    def from_fields(cls, data: List[str]) -> Optional['Supplier']:
+        """Creates a Supplier instance from a list of already split fields."""
         try:
-            data = line.strip().split("|")
             if len(data) == 3:
-                return cls(data[0], data[1], data[2])
+                return cls(sys.intern(data[0]), data[1], data[2])
         except (ValueError, IndexError):
             return None
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """
     Represents a customer order in the inventory system.
@@ -99,20 +120,24 @@ class Order:
 
     def to_string(self) -> str:
         """Converts an Order instance to a pipe-delimited string format for file storage."""
-        return f"{self.order_id}|{self.product_id}|{self.quantity}|{self.order_date}"
+        return "|".join((self.order_id, self.product_id, str(self.quantity), self.order_date))
 
     @classmethod
     def from_string(cls, line: str) -> Optional['Order']:
         """Creates an Order instance from a pipe-delimited string."""
+        return cls.from_fields(line.strip().split("|"))
+
+    @classmethod
+    def from_fields(cls, data: List[str]) -> Optional['Order']:
+        """Creates an Order instance from a list of already split fields."""
         try:
-            data = line.strip().split("|")
             if len(data) == 4:
                 quantity = int(data[2])
-                return cls(data[0], data[1], quantity, data[3])
+                return cls(data[0], sys.intern(data[1]), quantity, sys.intern(data[3]))
         except (ValueError, IndexError):
             return None
 
-@dataclass
+@dataclass(slots=True)
 class SupplierOrder:
     """
     Represents a supplier order in the inventory system.
@@ -131,16 +156,20 @@ class SupplierOrder:
 
     def to_string(self) -> str:
         """Converts a SupplierOrder instance to a pipe-delimited string format for file storage."""
-        return f"{self.order_id}|{self.supplier_id}|{self.product_id}|{self.quantity}|{self.order_date}"
+        return "|".join((self.order_id, self.supplier_id, self.product_id, str(self.quantity), self.order_date))
 
     @classmethod
     def from_string(cls, line: str) -> Optional['SupplierOrder']:
         """Creates a SupplierOrder instance from a pipe-delimited string."""
+        return cls.from_fields(line.strip().split("|"))
+
+    @classmethod
+    def from_fields(cls, data: List[str]) -> Optional['SupplierOrder']:
+        """Creates a SupplierOrder instance from a list of already split fields."""
         try:
-            data = line.strip().split("|")
             if len(data) == 5:
                 quantity = int(data[3])
-                return cls(data[0], data[1], data[2], quantity, data[4])
+                return cls(data[0], sys.intern(data[1]), sys.intern(data[2]), quantity, sys.intern(data[4]))
         except (ValueError, IndexError):
             return None
 
@@ -151,22 +180,55 @@ class FileManager:
     """
     @staticmethod
     def load_data_from_file(filename: str, parser_func) -> List:
-        items = []
-        if os.path.exists(filename):
-            with open(filename, "r") as f:
-                next(f, None)  # Skip header
-                for line in f:
-                    item = parser_func(line)
-                    if item:
-                        items.append(item)
-        return items
+        """Reads a pipe-delimited file and builds one item per row.
+        The file is read in a single call and split into lines at once; rows are then split by
+        the csv module's C parser and passed to parser_func as a list of fields.
+        """
+        try:
+            f = open(filename, "r")
+        except FileNotFoundError:
+            return []
+        with f:
+            lines = f.read().split("\n")
+        # Lines are stripped as a whole before splitting, so stray whitespace at either end is ignored
+        reader = csv.reader(map(str.strip, lines), delimiter="|", quoting=csv.QUOTE_NONE)
+        next(reader, None)  # Skip header
+        try:
+            # map/filter drive the per-row loop from C; blank or invalid rows parse to None and are dropped
+            return list(filter(None, map(parser_func, reader)))
+        except csv.Error:
+            # A field is longer than csv.field_size_limit(); split every line in Python instead
+            rows = (line.strip().split("|") for line in lines[1:])
+            return list(filter(None, map(parser_func, rows)))
+
+    @staticmethod
+    def save_data_to_file(filename: str, header: str, items: Iterable):
+        """Rewrites a file with a header row followed by one line per item, in a single write.
+        The data is written to a temporary file first and then moved over the original,
+        so an interrupted save never leaves a partially written file behind.
+        """
+        lines = [header]
+        lines.extend(item.to_string() for item in items)
+        temp_filename = filename + ".tmp"
+        with open(temp_filename, "w") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(temp_filename, filename)
 
     @staticmethod
-    def save_data_to_file(filename: str, header: str, items: List):
-        with open(filename, "w") as f:
-            f.write(header + "\n")
-            for item in items:
-                f.write(item.to_string() + "\n")
+    def append_line(filename: str, header: str, line: str):
+        """Appends a single record to a file, writing the header first if the file is new or empty.
+        A newline is added first if the file does not already end with one, e.g. after a hand edit.
+        """
+        with open(filename, "a+") as f:
+            if f.tell() == 0:
+                f.write(header + "\n")
+            else:
+                f.buffer.seek(-1, os.SEEK_END)
+                ends_with_newline = f.buffer.read(1) == b"\n"
+                f.seek(0, os.SEEK_END)
+                if not ends_with_newline:
+                    f.write("\n")
+            f.write(line + "\n")
 
 class InventoryManagementSystem:
     """
@@ -177,20 +239,47 @@ class InventoryManagementSystem:
         products (Dict[str, Product]): A dictionary of products with product ID as key
         suppliers (Dict[str, Supplier]): A dictionary of suppliers with supplier ID as key
         orders (List[Order]): A list of customer orders
+        orders_by_product (Dict[str, List[Order]]): Customer orders grouped by product ID
+        sales_totals (DefaultDict[str, int]): Total quantity sold per product ID
+        low_stock (Set[str]): IDs of products whose stock is below LOW_STOCK_THRESHOLD
         supplier_orders (List[SupplierOrder]): A list of supplier orders
+        next_order_seq (int): Sequence number used for the next customer order ID
+        next_supplier_order_seq (int): Sequence number used for the next supplier order ID
         file_manager (FileManager): Utility class for file I/O operations
+        dirty (bool): Whether there are in-memory changes not yet written back by save_data
+        autosave (bool): Whether new records are appended to their file as soon as they are created
     """
+    # The instance that owns the data files; older instances can no longer change or save data
+    _active_instance: Optional['InventoryManagementSystem'] = None
+
     def __init__(self):
         """Initializes the InventoryManagementSystem with data from files.
         The system loads product, supplier, order, and supplier order data from files.
+        The new instance takes over the data files: a previous instance's pending changes are
+        saved before loading, and that instance raises RuntimeError if it is changed or saved afterwards.
         """
         
         self.products: Dict[str, Product] = {}
         self.suppliers: Dict[str, Supplier] = {}
         self.orders: List[Order] = []
+        self.orders_by_product: Dict[str, List[Order]] = {}
+        self.sales_totals: DefaultDict[str, int] = defaultdict(int)
+        self.low_stock: Set[str] = set()
         self.supplier_orders: List[SupplierOrder] = []
+        self.next_order_seq = 1
+        self.next_supplier_order_seq = 1
         self.file_manager = FileManager()
+        self.dirty = False
+        self.autosave = True
+        previous = InventoryManagementSystem._active_instance
+        if previous is not None:
+            previous.save_pending_changes()
+            atexit.unregister(previous.save_pending_changes)
         self.load_data()
+        # New records are appended as they are created; anything still unsaved
+        # (such as a partially applied product update) is written when the program closes.
+        InventoryManagementSystem._active_instance = self
+        atexit.register(self.save_pending_changes)
 
     def load_data(self):
         """
@@ -198,35 +287,92 @@ class InventoryManagementSystem:
         The data is loaded into the respective attributes of the InventoryManagementSystem.   
         """
         self.products = {
-            p.product_id: p for p in self.file_manager.load_data_from_file("products.txt", Product.from_string) if p
+            p.product_id: p for p in self.file_manager.load_data_from_file("products.txt", Product.from_fields)
         }
         self.suppliers = {
-            s.supplier_id: s for s in self.file_manager.load_data_from_file("suppliers.txt", Supplier.from_string) if s
+            s.supplier_id: s for s in self.file_manager.load_data_from_file("suppliers.txt", Supplier.from_fields)
         }
-        self.orders = [
-            o for o in self.file_manager.load_data_from_file("orders.txt", Order.from_string) if o
-        ]
-        self.supplier_orders = [
-            so for so in self.file_manager.load_data_from_file("supplier_orders.txt", SupplierOrder.from_string) if so
-        ]
+        self.low_stock = {pid for pid, p in self.products.items() if p.stock < LOW_STOCK_THRESHOLD}
+        self.orders = self.file_manager.load_data_from_file("orders.txt", Order.from_fields)
+        self.orders_by_product = {}
+        self.sales_totals = defaultdict(int)
+        for order in self.orders:
+            self.orders_by_product.setdefault(order.product_id, []).append(order)
+            self.sales_totals[order.product_id] += order.quantity
+        self.supplier_orders = self.file_manager.load_data_from_file("supplier_orders.txt", SupplierOrder.from_fields)
+        self.next_order_seq = self._next_sequence((o.order_id for o in self.orders), "O")
+        self.next_supplier_order_seq = self._next_sequence((so.order_id for so in self.supplier_orders), "SO")
+
+    @staticmethod
+    def _next_sequence(order_ids, prefix: str) -> int:
+        """Returns one more than the highest numeric suffix among the order IDs that start with prefix."""
+        highest = 0
+        for order_id in order_ids:
+            suffix = order_id[len(prefix):]
+            if order_id.startswith(prefix) and suffix.isdecimal():
+                highest = max(highest, int(suffix))
+        return highest + 1
 
     def save_data(self):
         """
         Saves product, supplier, order, and supplier order data to files.
         The data is saved from the respective attributes of the InventoryManagementSystem.
         """
+        self._check_active()
         self.file_manager.save_data_to_file(
-            "products.txt", "product_id|name|description|price|stock|supplier_id", list(self.products.values())
+            "products.txt", PRODUCT_HEADER, self.products.values()
         )
         self.file_manager.save_data_to_file(
-            "suppliers.txt", "supplier_id|name|contact", list(self.suppliers.values())
+            "suppliers.txt", SUPPLIER_HEADER, self.suppliers.values()
         )
         self.file_manager.save_data_to_file(
-            "orders.txt", "order_id|product_id|quantity|order_date", self.orders
+            "orders.txt", ORDER_HEADER, self.orders
         )
         self.file_manager.save_data_to_file(
-            "supplier_orders.txt", "order_id|supplier_id|product_id|quantity|order_date", self.supplier_orders
+            "supplier_orders.txt", SUPPLIER_ORDER_HEADER, self.supplier_orders
         )
+        self.dirty = False
+
+    def _check_active(self):
+        """Raises RuntimeError if a newer instance has taken over the data files."""
+        if InventoryManagementSystem._active_instance is not self:
+            raise RuntimeError("This inventory has been replaced by a newer InventoryManagementSystem instance!")
+
+    def _record_order(self, filename: str, header: str, order):
+        """
+        Appends a new order to its file and rewrites products.txt so the stored stock matches the order.
+        Both are deferred to the next save when autosave is off.
+        """
+        if self.autosave:
+            self.file_manager.append_line(filename, header, order.to_string())
+            self.file_manager.save_data_to_file("products.txt", PRODUCT_HEADER, self.products.values())
+        else:
+            self.dirty = True
+
+    def save_pending_changes(self):
+        """Saves all data to files if there are changes that have not been written yet."""
+        if self.dirty:
+            self.save_data()
+
+    def _record_added(self, filename: str, header: str, item):
+        """Appends a newly created record to its file, or defers it to the next save when autosave is off."""
+        if self.autosave:
+            self.file_manager.append_line(filename, header, item.to_string())
+        else:
+            self.dirty = True
+
+    def _update_low_stock(self, product: Product):
+        """Adds or removes a product from the low stock set based on its current stock."""
+        if product.stock < LOW_STOCK_THRESHOLD:
+            self.low_stock.add(product.product_id)
+        else:
+            self.low_stock.discard(product.product_id)
+
+    @staticmethod
+    def _validate_text(label: str, value):
+        """Raises ValueError unless value is a string that fits in one pipe-delimited field."""
+        if not isinstance(value, str) or "|" in value or "\n" in value or "\r" in value:
+            raise ValueError(f"{label} must be text without '|' or line breaks!")
 
     def validate_numeric_input(self, prompt: str, convert_func, min_value: float = 0) -> Optional[float]:
         """
@@ -248,10 +394,49 @@ class InventoryManagementSystem:
             print("Invalid numeric input")
             return None
 
-    def add_product(self):
+    def add_product(self, product_id: str, name: str, description: str, price: float, stock: int,
+                    supplier_id: Optional[str] = None) -> Product:
         """
         Adds a new product to the inventory system.
-        The user is prompted to enter product details, and the product is added to the product dictionary.
+        Args:
+            product_id (str): Unique identifier for the product
+            name (str): Name of the product
+            description (str): Product description
+            price (float): Product price
+            stock (int): Initial quantity in stock
+            supplier_id (Optional[str]): ID of an existing supplier, if any
+        Returns:
+            Product: The product that was added
+        Raises:
+            ValueError: If a text field is not a string or contains '|' or a line break, the product ID
+                is empty or a duplicate, the price is not a number >= 0, the stock is not an integer >= 0,
+                or the supplier does not exist
+            RuntimeError: If a newer instance has taken over the data files
+        """
+        self._check_active()
+        self._validate_text("Product ID", product_id)
+        self._validate_text("Product name", name)
+        self._validate_text("Product description", description)
+        if supplier_id is not None:
+            self._validate_text("Supplier ID", supplier_id)
+        if not product_id or product_id in self.products:
+            raise ValueError("Invalid or duplicate Product ID!")
+        if isinstance(price, bool) or not isinstance(price, (int, float)) or not price >= 0:
+            raise ValueError("Price must be a number greater than or equal to 0!")
+        if isinstance(stock, bool) or not isinstance(stock, int) or stock < 0:
+            raise ValueError("Stock must be a whole number greater than or equal to 0!")
+        if supplier_id and supplier_id not in self.suppliers:
+            raise ValueError("Supplier not found!")
+
+        product = Product(product_id, name, description, price, stock, supplier_id or None)
+        self.products[product_id] = product
+        self._update_low_stock(product)
+        self._record_added("products.txt", PRODUCT_HEADER, product)
+        return product
+
+    def add_product_from_input(self):
+        """
+        Prompts the user for product details and adds the product to the inventory system.
         """
         product_id = input("Enter product ID: ").strip()
         if not product_id or product_id in self.products:
@@ -261,27 +446,56 @@ class InventoryManagementSystem:
         name = input("Enter product name: ").strip()
         description = input("Enter product description: ").strip()
         price = self.validate_numeric_input("Enter product price: ", float)
+        if price is None:
+            return
         stock = self.validate_numeric_input("Enter initial stock: ", int)
+        if stock is None:
+            return
 
         print("\nAvailable suppliers:")
         for supplier_id, supplier in self.suppliers.items():
             print(f"{supplier_id}: {supplier.name}")
 
         supplier_id = input("Enter supplier ID (press Enter to skip): ").strip()
-        if supplier_id and supplier_id not in self.suppliers:
-            print("Supplier not found!")
+        try:
+            self.add_product(product_id, name, description, price, stock, supplier_id or None)
+        except ValueError as e:
+            print(e)
             return
-        product = Product(product_id, name, description, price, stock, supplier_id or None)
-        self.products[product_id] = product
-        self.save_data()
         print("Product added successfully!")
 
+    def bulk_load_products(self, records: Iterable) -> int:
+        """
+        Adds many products in one go, e.g. from an import script.
+        Autosave is switched off while the records are added, and all data is then written with a single save.
+        Args:
+            records (Iterable): Tuples of add_product arguments
+        Returns:
+            int: The number of products added
+        Raises:
+            ValueError: If a record is invalid; products added before it are kept and saved
+            RuntimeError: If a newer instance has taken over the data files
+        """
+        self._check_active()
+        count = 0
+        self.autosave = False
+        try:
+            for record in records:
+                self.add_product(*record)
+                count += 1
+        finally:
+            self.autosave = True
+            if count:
+                self.save_data()
+        return count
+
     def update_product(self):
         """
         Updates an existing product in the inventory system.
         The user is prompted to enter the product ID to update, and then the new product details.
         The product details are updated in the product dictionary.
         """
+        self._check_active()
         old_product_id = input("Enter product ID to update: ")
         if old_product_id not in self.products:
             print("Product not found!")
@@ -303,51 +517,93 @@ class InventoryManagementSystem:
                 print("New product ID already exists!")
                 return
             del self.products[old_product_id]
+            self.low_stock.discard(old_product_id)
             product.product_id = new_product_id
             self.products[new_product_id] = product
+            self._update_low_stock(product)
+            self.dirty = True
             # Update product ID in orders
-            for order in self.orders:
-                if order.product_id == old_product_id:
-                    order.product_id = new_product_id
+            moved_orders = self.orders_by_product.pop(old_product_id, [])
+            for order in moved_orders:
+                order.product_id = new_product_id
+            if moved_orders:
+                self.orders_by_product.setdefault(new_product_id, []).extend(moved_orders)
+                self.sales_totals[new_product_id] += self.sales_totals.pop(old_product_id)
 
         # Update other fields
         name = input("Enter new name (press Enter to keep current): ").strip()
         if name:
             product.name = name
+            self.dirty = True
 
         description = input("Enter new description (press Enter to keep current): ")
         if description:
             product.description = description
+            self.dirty = True
 
         new_price = input("Enter new price (press Enter to keep current): ")
         if new_price:
             price = self.validate_numeric_input("Enter new price: ", float)
             if price is not None:
                 product.price = price
+                self.dirty = True
 
         new_stock = input("Enter new stock (press Enter to keep current): ")
         if new_stock:
             stock = self.validate_numeric_input("Enter new stock: ", int)
             if stock is not None:
                 product.stock = stock
+                self._update_low_stock(product)
+                self.dirty = True
 
         supplier_id = input("Enter new supplier ID (press Enter to keep current, 'none' to remove): ").strip().lower()
         if supplier_id:
             if supplier_id == 'none':
                 product.supplier_id = None
+                self.dirty = True
             elif supplier_id not in self.suppliers:
                 print("Supplier not found!")
                 return
             else:
                 product.supplier_id = supplier_id
+                self.dirty = True
 
         self.save_data()
         print("Product updated successfully!")
 
-    def add_supplier(self):
-        """"
+    def add_supplier(self, supplier_id: str, name: str, contact: str) -> Supplier:
+        """
         Adds a new supplier to the inventory system.
-        The user is prompted to enter supplier details, and the supplier is added to the supplier dictionary.
+        Args:
+            supplier_id (str): Unique identifier for the supplier
+            name (str): Name of the supplier
+            contact (str): Contact information for the supplier
+        Returns:
+            Supplier: The supplier that was added
+        Raises:
+            ValueError: If a field is not a string or contains '|' or a line break, the supplier ID is
+                empty or a duplicate, or the name is empty
+            RuntimeError: If a newer instance has taken over the data files
+        """
+        self._check_active()
+        self._validate_text("Supplier ID", supplier_id)
+        self._validate_text("Supplier name", name)
+        self._validate_text("Supplier contact", contact)
+        if not supplier_id:
+            raise ValueError("Supplier ID cannot be empty!")
+        if supplier_id in self.suppliers:
+            raise ValueError("Supplier ID already exists!")
+        if not name:
+            raise ValueError("Supplier name cannot be empty!")
+
+        supplier = Supplier(supplier_id, name, contact)
+        self.suppliers[supplier_id] = supplier
+        self._record_added("suppliers.txt", SUPPLIER_HEADER, supplier)
+        return supplier
+
+    def add_supplier_from_input(self):
+        """
+        Prompts the user for supplier details and adds the supplier to the inventory system.
         """
         supplier_id = input("Enter supplier ID: ").strip()
         if not supplier_id:
@@ -363,17 +619,48 @@ class InventoryManagementSystem:
             return
 
         contact = input("Enter supplier contact details: ")
-        
-        supplier = Supplier(supplier_id, name, contact)
-        self.suppliers[supplier_id] = supplier
-        self.save_data()
+        try:
+            self.add_supplier(supplier_id, name, contact)
+        except ValueError as e:
+            print(e)
+            return
         print("Supplier added successfully!")
-        
-    def place_customer_order(self):
+
+    def place_customer_order(self, product_id: str, quantity: int) -> Order:
         """
-        Places a new customer order in the inventory system.
-        The user is prompted to enter the product ID and quantity for the order.
-        If the product is available in stock, the order is placed and the product stock is updated.
+        Places a new customer order in the inventory system and reduces the product stock.
+        Args:
+            product_id (str): ID of the product ordered
+            quantity (int): Quantity of the product ordered
+        Returns:
+            Order: The order that was placed
+        Raises:
+            ValueError: If the product does not exist, or the quantity is not an integer >= 1 or exceeds the stock
+            RuntimeError: If a newer instance has taken over the data files
+        """
+        self._check_active()
+        product = self.products.get(product_id)
+        if product is None:
+            raise ValueError("Product not found!")
+        if isinstance(quantity, bool) or not isinstance(quantity, int) or quantity < 1 or product.stock < quantity:
+            raise ValueError("Insufficient stock or invalid quantity!")
+
+        order_id = f"O{self.next_order_seq:03d}"
+        self.next_order_seq += 1
+        order_date = date.today().isoformat()
+
+        order = Order(order_id, product_id, quantity, order_date)
+        self.orders.append(order)
+        self.orders_by_product.setdefault(product_id, []).append(order)
+        self.sales_totals[product_id] += quantity
+        product.stock -= quantity
+        self._update_low_stock(product)
+        self._record_order("orders.txt", ORDER_HEADER, order)
+        return order
+
+    def place_customer_order_from_input(self):
+        """
+        Prompts the user for the product ID and quantity and places a customer order.
         """
         print("\nAvailable products:")
         for product_id, product in self.products.items():
@@ -385,24 +672,53 @@ class InventoryManagementSystem:
             return
 
         quantity = self.validate_numeric_input("Enter quantity: ", int, 1)
-        if quantity is None or self.products[product_id].stock < quantity:
+        if quantity is None:
             print("Insufficient stock or invalid quantity!")
             return
+        try:
+            self.place_customer_order(product_id, quantity)
+        except ValueError as e:
+            print(e)
+            return
+        print("Customer order placed successfully!")
 
-        order_id = f"O{len(self.orders) + 1:03d}"
-        order_date = datetime.now().strftime("%Y-%m-%d")
+    def place_supplier_order(self, supplier_id: str, product_id: str, quantity: int) -> SupplierOrder:
+        """
+        Places a new supplier order in the inventory system and increases the product stock.
+        Args:
+            supplier_id (str): ID of the supplier
+            product_id (str): ID of the product ordered
+            quantity (int): Quantity of the product ordered
+        Returns:
+            SupplierOrder: The supplier order that was placed
+        Raises:
+            ValueError: If the supplier or product does not exist, or the quantity is not an integer >= 1
+            RuntimeError: If a newer instance has taken over the data files
+        """
+        self._check_active()
+        if supplier_id not in self.suppliers:
+            raise ValueError("Supplier not found!")
+        product = self.products.get(product_id)
+        if product is None:
+            raise ValueError("Product not found!")
+        if isinstance(quantity, bool) or not isinstance(quantity, int) or quantity < 1:
+            raise ValueError("Invalid quantity!")
 
-        order = Order(order_id, product_id, quantity, order_date)
-        self.orders.append(order)
-        self.products[product_id].stock -= quantity
-        self.save_data()
-        print("Customer order placed successfully!")
+        order_id = f"SO{self.next_supplier_order_seq:03d}"
+        self.next_supplier_order_seq += 1
+        order_date = date.today().isoformat()
+
+        supplier_order = SupplierOrder(order_id, supplier_id, product_id, quantity, order_date)
+        self.supplier_orders.append(supplier_order)
+
+        product.stock += quantity
+        self._update_low_stock(product)
+        self._record_order("supplier_orders.txt", SUPPLIER_ORDER_HEADER, supplier_order)
+        return supplier_order
 
-    def place_supplier_order(self):
+    def place_supplier_order_from_input(self):
         """
-        Places a new supplier order in the inventory system.
-        The user is prompted to enter the supplier ID, product ID, and quantity for the order.
-        The order is placed and the product stock is updated based on the supplier order.
+        Prompts the user for the supplier ID, product ID and quantity and places a supplier order.
         """
         print("\nAvailable suppliers:")
         for supplier_id, supplier in self.suppliers.items():
@@ -425,28 +741,23 @@ class InventoryManagementSystem:
         quantity = self.validate_numeric_input("Enter quantity: ", int, 1)
         if quantity is None:
             return
-
-        order_id = f"SO{len(self.supplier_orders) + 1:03d}"
-        order_date = datetime.now().strftime("%Y-%m-%d")
-
-        supplier_order = SupplierOrder(order_id, supplier_id, product_id, quantity, order_date)
-        self.supplier_orders.append(supplier_order)
-
-        self.products[product_id].stock += quantity
-        self.save_data()
+        self.place_supplier_order(supplier_id, product_id, quantity)
         print("Supplier order placed successfully and inventory updated!")
 
     def view_inventory(self):
         """
         Displays the current inventory of products in the system.
         The product ID, name, stock, description, price, and supplier are displayed for each product.
-        """  
-        print("\nCurrent Inventory:")
-        print("ID | Name | Stock | Description | Price | Supplier")
-        for product in self.products.values():
-        # Fix: Handle the supplier lookup properly
-            supplier_name = self.suppliers[product.supplier_id].name if product.supplier_id and product.supplier_id in self.suppliers else 'N/A'
-            print(f"{product.product_id} | {product.name} | {product.stock} | {product.description} | ${product.price:.2f} | {supplier_name}")
+        The lines are collected first and written to stdout in a single call.
+        """
+        supplier_names = {sid: s.name for sid, s in self.suppliers.items()}
+        lines = ["\nCurrent Inventory:", "ID | Name | Stock | Description | Price | Supplier"]
+        lines.extend(
+            f"{p.product_id} | {p.name} | {p.stock} | {p.description} | ${p.price:.2f} | "
+            f"{supplier_names.get(p.supplier_id, 'N/A')}"
+            for p in self.products.values()
+        )
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def generate_reports(self):
         """
@@ -455,7 +766,7 @@ class InventoryManagementSystem:
         """
         while True:
             print("\nReports Menu:")
-            print("1. Low Stock Items (< 5 units)")
+            print(f"1. Low Stock Items (< {LOW_STOCK_THRESHOLD} units)")
             print("2. Product Sales Report")
             print("3. Supplier Order History:")
             print("4. Back to Main Menu")
@@ -475,44 +786,36 @@ class InventoryManagementSystem:
 
     def _generate_low_stock_report(self):
         """
-        Generates a report of low stock items (stock < 5) in the inventory system.
+        Generates a report of low stock items (stock < LOW_STOCK_THRESHOLD) in the inventory system.
         The product ID, name, and current stock are displayed for each low stock item.
+        Only products tracked in the low_stock set are looked up.
         """
-        low_stock_items = [(p.product_id, p.name, p.stock) 
-                          for p in self.products.values() if p.stock < 5]
+        low_stock_items = [self.products[pid] for pid in sorted(self.low_stock)]
         if not low_stock_items:
             print("\nNo low stock items found.")
             return
 
-        print("\nLow Stock Items:")
-        print("ID | Name | Stock")
-        print("-" * 30)
-        for pid, name, stock in low_stock_items:
-            print(f"{pid} | {name} | {stock}")
+        lines = ["\nLow Stock Items:", "ID | Name | Stock", "-" * 30]
+        lines.extend(f"{p.product_id} | {p.name} | {p.stock}" for p in low_stock_items)
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def _generate_sales_report(self):
         """
         Generates a product sales report based on the customer orders in the inventory system.
         The total quantity sold and revenue generated for each product are displayed in the report.
+        Quantities come from sales_totals, which is kept up to date as orders are placed.
         """
         if not self.orders:
             print("\nNo orders found.")
             return
 
-        sales_data = {}
-        for order in self.orders:
-            if order.product_id not in sales_data:
-                sales_data[order.product_id] = 0
-            sales_data[order.product_id] += order.quantity
-
-        print("\nProduct Sales Report:")
-        print("Product ID | Product Name | Total Quantity Sold | Total Revenue")
-        print("-" * 65)
-        for product_id, quantity in sales_data.items():
+        lines = ["\nProduct Sales Report:", "Product ID | Product Name | Total Quantity Sold | Total Revenue", "-" * 65]
+        for product_id, quantity in self.sales_totals.items():
             product = self.products.get(product_id)
             if product:
                 revenue = quantity * product.price
-                print(f"{product_id} | {product.name} | {quantity} | ${revenue:.2f}")
+                lines.append(f"{product_id} | {product.name} | {quantity} | ${revenue:.2f}")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def _generate_supplier_report(self):
         """
@@ -523,20 +826,16 @@ class InventoryManagementSystem:
             print("\nNo supplier orders found.")
             return
 
-        print("\nSupplier Order History:")
-        print("Order ID | Supplier | Product | Quantity | Order Date")
-        print("-" * 80)
-    
+        lines = ["\nSupplier Order History:", "Order ID | Supplier | Product | Quantity | Order Date", "-" * 80]
+
+        # Look names up once per report; IDs missing from either dictionary fall back to a placeholder
+        supplier_names = {sid: s.name for sid, s in self.suppliers.items()}
+        product_names = {pid: p.name for pid, p in self.products.items()}
         for order in self.supplier_orders:
-            try:
-                # Safely get supplier and product information
-                supplier_name = self.suppliers.get(order.supplier_id, Supplier(order.supplier_id, "Unknown Supplier", "")).name
-                product_name = self.products.get(order.product_id, Product(order.product_id, "Unknown Product", "", 0.0)).name
-            
-                print(f"{order.order_id} | {supplier_name} | {product_name} | {order.quantity} | {order.order_date}")
-            except Exception as e:
-                print(f"Error processing order {order.order_id}: {str(e)}")
-                continue
+            supplier_name = supplier_names.get(order.supplier_id, "Unknown Supplier")
+            product_name = product_names.get(order.product_id, "Unknown Product")
+            lines.append(f"{order.order_id} | {supplier_name} | {product_name} | {order.quantity} | {order.order_date}")
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def main_menu(self):
         """
@@ -548,15 +847,15 @@ class InventoryManagementSystem:
             choice = input("Enter your choice (1-8): ").strip()
 
             if choice == "1":
-                self.add_product()
+                self.add_product_from_input()
             elif choice == "2":
                 self.update_product()
             elif choice == "3":
-                self.add_supplier()
+                self.add_supplier_from_input()
             elif choice == "4":
-                self.place_customer_order()
+                self.place_customer_order_from_input()
             elif choice == "5":
-                self.place_supplier_order()
+                self.place_supplier_order_from_input()
             elif choice == "6":
                 self.view_inventory()
             elif choice == "7":
@@ -0,0 +1,204 @@
+"""
+Tests for the programmatic API of the Inventory Management System.
+Each test runs in a temporary directory holding a small set of data files.
+"""
+import atexit
+import importlib.util
+import os
+import tempfile
+import unittest
+
+MODULE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           "Inventory Management System.py")
+spec = importlib.util.spec_from_file_location("inventory_management_system", MODULE_PATH)
+ims = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(ims)
+
+DATA_FILES = {
+    "products.txt": ims.PRODUCT_HEADER + "\n"
+                    "001|Widget|Small widget|2.5|10|S01\n"
+                    "002|Gadget|Large gadget|10.0|3|\n",
+    "suppliers.txt": ims.SUPPLIER_HEADER + "\nS01|Acme|acme@example.com\n",
+    "orders.txt": ims.ORDER_HEADER + "\nO001|001|2|2024-12-21\n",
+    "supplier_orders.txt": ims.SUPPLIER_ORDER_HEADER + "\nSO001|S01|001|5|2024-12-21\n",
+}
+
+
+class InventoryTestCase(unittest.TestCase):
+    """Creates a fresh data directory and system for each test."""
+
+    def setUp(self):
+        self.old_cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+        for filename, content in DATA_FILES.items():
+            with open(filename, "w") as f:
+                f.write(content)
+        self.system = self.new_system()
+
+    def tearDown(self):
+        atexit.unregister(self.system.save_pending_changes)
+        ims.InventoryManagementSystem._exit_instance = None
+        os.chdir(self.old_cwd)
+        self.tmp.cleanup()
+
+    def new_system(self):
+        system = ims.InventoryManagementSystem()
+        atexit.unregister(system.save_pending_changes)
+        return system
+
+    def read(self, filename):
+        with open(filename) as f:
+            return f.read()
+
+
+class AddProductTests(InventoryTestCase):
+
+    def test_adds_and_appends_product(self):
+        self.system.add_product("003", "Gizmo", "Tiny gizmo", 1.0, 7, "S01")
+        self.assertIn("003|Gizmo|Tiny gizmo|1.0|7|S01\n", self.read("products.txt"))
+        self.assertEqual(self.new_system().products["003"].stock, 7)
+
+    def test_rejects_invalid_text_fields(self):
+        invalid = [
+            (None, "n", "d"),
+            ("P9", None, "d"),
+            ("P9", "n", "a|b"),
+            ("P9\n", "n", "d"),
+            ("P9", "n\r", "d"),
+        ]
+        before = self.read("products.txt")
+        for product_id, name, description in invalid:
+            with self.assertRaises(ValueError):
+                self.system.add_product(product_id, name, description, 1.0, 1)
+        with self.assertRaises(ValueError):
+            self.system.add_product("P9", "n", "d", 1.0, 1, 5)
+        self.assertNotIn("P9", self.system.products)
+        self.assertEqual(self.read("products.txt"), before)
+
+    def test_rejects_invalid_price_and_stock(self):
+        for price, stock in [(-3, 1), (None, 1), ("1.0", 1), (float("nan"), 1), (True, 1),
+                             (1.0, -7), (1.0, None), (1.0, "5"), (1.0, 2.5), (1.0, True)]:
+            with self.assertRaises(ValueError):
+                self.system.add_product("P9", "n", "d", price, stock)
+        self.assertNotIn("P9", self.system.products)
+        self.assertNotIn("P9", self.read("products.txt"))
+
+    def test_rejects_duplicate_id_and_unknown_supplier(self):
+        with self.assertRaises(ValueError):
+            self.system.add_product("001", "n", "d", 1.0, 1)
+        with self.assertRaises(ValueError):
+            self.system.add_product("003", "n", "d", 1.0, 1, "S99")
+
+    def test_updates_low_stock(self):
+        self.system.add_product("003", "Gizmo", "d", 1.0, 2)
+        self.assertIn("003", self.system.low_stock)
+
+
+class AddSupplierTests(InventoryTestCase):
+
+    def test_adds_and_appends_supplier(self):
+        self.system.add_supplier("S02", "Globex", "+1 555 0100")
+        self.assertIn("S02|Globex|+1 555 0100\n", self.read("suppliers.txt"))
+
+    def test_rejects_invalid_fields(self):
+        before = self.read("suppliers.txt")
+        for supplier_id, name, contact in [("S02", "Globex", None), ("S02", "Glo|bex", "c"),
+                                           (2, "Globex", "c"), ("", "Globex", "c"), ("S02", "", "c"),
+                                           ("S01", "Globex", "c")]:
+            with self.assertRaises(ValueError):
+                self.system.add_supplier(supplier_id, name, contact)
+        self.assertNotIn("S02", self.system.suppliers)
+        self.assertEqual(self.read("suppliers.txt"), before)
+
+
+class OrderTests(InventoryTestCase):
+
+    def test_customer_order_updates_stock_on_disk(self):
+        order = self.system.place_customer_order("001", 4)
+        self.assertEqual(order.order_id, "O002")
+        reloaded = self.new_system()
+        self.assertEqual(reloaded.products["001"].stock, 6)
+        self.assertEqual(reloaded.sales_totals["001"], 6)
+
+    def test_customer_order_rejects_invalid_quantity(self):
+        for quantity in [2.5, True, 0, 11, "1"]:
+            with self.assertRaises(ValueError):
+                self.system.place_customer_order("001", quantity)
+        with self.assertRaises(ValueError):
+            self.system.place_customer_order("999", 1)
+        self.assertEqual(len(self.system.orders), 1)
+        self.assertEqual(self.system.products["001"].stock, 10)
+
+    def test_supplier_order_updates_stock_on_disk(self):
+        self.system.place_supplier_order("S01", "002", 5)
+        self.assertNotIn("002", self.system.low_stock)
+        reloaded = self.new_system()
+        self.assertEqual(reloaded.products["002"].stock, 8)
+        self.assertEqual(reloaded.supplier_orders[-1].order_id, "SO002")
+
+    def test_supplier_order_rejects_invalid_quantity(self):
+        for quantity in [2.5, True, 0, "3"]:
+            with self.assertRaises(ValueError):
+                self.system.place_supplier_order("S01", "002", quantity)
+        with self.assertRaises(ValueError):
+            self.system.place_supplier_order("S99", "002", 1)
+        self.assertEqual(len(self.system.supplier_orders), 1)
+        self.assertEqual(self.system.products["002"].stock, 3)
+
+
+class BulkLoadProductsTests(InventoryTestCase):
+
+    def test_loads_all_records_with_one_save(self):
+        count = self.system.bulk_load_products([("B1", "Bulk", "d", 1.0, 10), ("B2", "Bulk", "d", 2.0, 1, "S01")])
+        self.assertEqual(count, 2)
+        self.assertTrue(self.system.autosave)
+        self.assertFalse(self.system.dirty)
+        self.assertEqual(set(self.new_system().products), {"001", "002", "B1", "B2"})
+
+    def test_invalid_record_keeps_earlier_records(self):
+        with self.assertRaises(ValueError):
+            self.system.bulk_load_products([("B1", "Bulk", "d", 1.0, 10), ("B2", None, "d", 1.0, 1)])
+        self.assertTrue(self.system.autosave)
+        reloaded = self.new_system()
+        self.assertEqual(set(reloaded.products), {"001", "002", "B1"})
+
+
+class InstanceHandoffTests(InventoryTestCase):
+
+    def test_new_instance_saves_previous_pending_changes(self):
+        self.system.products["001"].name = "Renamed"
+        self.system.dirty = True
+        newer = self.new_system()
+        self.assertEqual(newer.products["001"].name, "Renamed")
+
+    def test_superseded_instance_cannot_change_or_save_data(self):
+        newer = self.new_system()
+        before = self.read("products.txt")
+        with self.assertRaises(RuntimeError):
+            self.system.place_supplier_order("S01", "002", 3)
+        with self.assertRaises(RuntimeError):
+            self.system.add_product("003", "Gizmo", "d", 1.0, 1)
+        with self.assertRaises(RuntimeError):
+            self.system.save_data()
+        self.assertEqual(self.read("products.txt"), before)
+        newer.place_supplier_order("S01", "002", 3)
+        self.assertEqual(self.new_system().products["002"].stock, 6)
+
+
+class AppendLineTests(InventoryTestCase):
+
+    def test_writes_header_to_empty_file(self):
+        open("empty.txt", "w").close()
+        ims.FileManager.append_line("empty.txt", "h", "row")
+        self.assertEqual(self.read("empty.txt"), "h\nrow\n")
+
+    def test_adds_missing_trailing_newline(self):
+        with open("partial.txt", "w") as f:
+            f.write("h\nrow1")
+        ims.FileManager.append_line("partial.txt", "h", "row2")
+        self.assertEqual(self.read("partial.txt"), "h\nrow1\nrow2\n")
+
+
+if __name__ == "__main__":
+    unittest.main()